@@ -16,9 +16,13 @@ Implemented Algorithms:
         1. Try adding the current edge to the candidate subgraph.
         2. Check if the resulting subgraph is planar using LR-algorithm.
         3. Backtrack if planarity is violated.
-   - Keeps track of the largest planar subset of edges found.
+   - Keeps track of the largest planar subset of edges found, starting from
+     a greedy planar subgraph as the initial lower bound.
    - Returns the adjacency dictionary representing the maximum planar subgraph.
 
+   - `maximal_planar_subgraph(graph)` is the incremental heuristic instead:
+     every edge is kept if the subgraph stays planar, m planarity tests in total.
+
 2. Planarity Check (LR-algorithm)
    --------------------------------
    - LR-algorithm is a linear-time algorithm for checking graph planarity.
@@ -39,8 +43,13 @@ Implemented Algorithms:
    - `add_edge(graph, u, v)`: Adds an edge to an adjacency dictionary.
    - `remove_edge(graph, u, v)`: Removes an edge from an adjacency dictionary.
    - `get_edges(graph)`: Returns a list of all edges as tuples (u, v).
-   - `is_planar_lr(graph_dict)`: Converts adjacency dictionary to networkx.Graph and
-     uses LR-algorithm to check planarity.
+   - `reduce_graph(graph)`: Removes leaves and contracts degree-2 vertices before the DFS.
+   - `planar_edge_bound(graph)`: Euler upper bound on the size of a planar subgraph
+     (3n - 6, or 2n - 4 for triangle-free graphs).
+   - `is_planar_lr(graph_dict)`: Runs the LR-algorithm directly on an adjacency
+     dictionary to check planarity.
+   - `incremental_planar_graph`: planar subgraph grown one edge at a time by the DFS;
+     `try_add_edge(u, v)` keeps the edge only if planarity is preserved.
 
 Graph Representation:
 --------------------
@@ -51,15 +60,20 @@ Graph Representation:
       ...
     }
 - Edges are stored as tuples (u, v) for processing.
-- Planarity check is performed via the LR-algorithm on a networkx.Graph object.
+- Planarity check is performed via the LR-algorithm on a networkx.Graph object
+  or directly on an adjacency dictionary.
 
 Usage:
 ------
 result = maximum_planar_subgraph(G)
 """
 
-from collections import defaultdict, deque
-from itertools import islice
+import multiprocessing
+from array import array
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import product
+from multiprocessing.sharedctypes import Synchronized
 
 import networkx as nx
 
@@ -83,17 +97,38 @@ def is_planar(g):
     Returns:
         bool: True if the graph is planar, False otherwise.
     """
-    if g.size() < 9 or g.order() < 5:
+    # networkx computes size() by summing degrees, so query it only once
+    m, n = g.size(), g.order()
+
+    if m < 9 or n < 5:
         return True
 
     # m > 3n - 6
-    if g.size() > 3 * g.order() - 6:
+    if m > 3 * n - 6:
         return False
 
-    dfs_heights = defaultdict(lambda: -1)
+    # filled in C up front instead of calling a default factory per vertex
+    return lr_planarity(g, g, dict.fromkeys(g, -1))
+
+
+def lr_planarity(g, vertices, dfs_heights):
+    """
+    Run the LR-algorithm on every connected component of a graph.
+
+    Works on anything that yields the neighbours of v as `g[v]`: a
+    networkx.Graph, an adjacency dictionary, or a list of neighbour sets
+    indexed by vertices 0..n-1 (in which case `dfs_heights` can be a list).
 
-    for v in g.nodes():
-        if dfs_heights[v] < 0:
+    Args:
+        g: The graph to check.
+        vertices (Iterable): Vertices of the graph.
+        dfs_heights (dict | list): Maps every vertex to -1; filled with DFS heights.
+
+    Returns:
+        bool: True if the graph is planar, False otherwise.
+    """
+    for v in vertices:
+        if g[v] and dfs_heights[v] < 0:
             dfs_heights[v] = 0
 
             if not lr_algorithm(g, v, dfs_heights):
@@ -119,9 +154,9 @@ def lr_algorithm(g, root, dfs_heights):
         5. If any merge/prune operation fails, the graph is non-planar.
 
     Args:
-        g (networkx.Graph): The graph to check (must be connected).
+        g (networkx.Graph | dict[int, set[int]]): The graph to check (must be connected).
         root (int): The starting node for DFS.
-        dfs_heights (defaultdict): Dictionary mapping node -> DFS height (depth),
+        dfs_heights (dict | list): Mapping node -> DFS height (depth),
                                    initialized with -1 for unvisited nodes.
 
     Returns:
@@ -149,9 +184,7 @@ def lr_algorithm(g, root, dfs_heights):
             dfs_stack.pop()
 
             if len(fringes) > 1:
-                try:
-                    merge_fringes(fringes, dfs_heights[dfs_stack[-1][0]])
-                except Exception:
+                if not merge_fringes(fringes, dfs_heights[dfs_stack[-1][0]]):
                     return False
 
     return True
@@ -170,20 +203,25 @@ def merge_fringes(fringes, dfs_height):
         fringes (list[list[fringe]]): A stack of fringe lists for the DFS tree.
         dfs_height (int): The DFS height of the parent node (used for pruning).
 
-    Raises:
-        Exception: If the merge or prune operation violates LR constraints (handled outside).
+    Returns:
+        bool: False if the merge violates LR constraints (the graph is non-planar),
+              True otherwise.
 
     Side Effects:
         Modifies the `fringes` list in-place, merging and pruning the topmost fringe.
     """
 
-    mf = get_merged_fringe(fringes.pop())
+    mf, ok = get_merged_fringe(fringes.pop())
+    if not ok:
+        return False
 
     if mf is not None:
         mf.prune(dfs_height)
         if mf.fops:
             fringes[-1].append(mf)
 
+    return True
+
 
 def get_merged_fringe(upper_fringes):
     """
@@ -197,7 +235,8 @@ def get_merged_fringe(upper_fringes):
         upper_fringes (list[fringe]): A list of `fringe` objects to merge.
 
     Returns:
-        fringe | None: The merged fringe if `upper_fringes` is not empty; otherwise None.
+        tuple[fringe | None, bool]: The merged fringe if `upper_fringes` is not empty,
+            otherwise None; and False if a merge violated LR constraints.
 
     Side Effects:
         The original `upper_fringes` list is not modified; a new merged `fringe` is returned.
@@ -205,9 +244,11 @@ def get_merged_fringe(upper_fringes):
     if len(upper_fringes) > 0:
         upper_fringes.sort()
         new_fringe = upper_fringes[0]
-        for f in islice(upper_fringes, 1, len(upper_fringes)):
-            new_fringe.merge(f)
-        return new_fringe
+        for f in upper_fringes[1:]:
+            if not new_fringe.merge(f):
+                return None, False
+        return new_fringe, True
+    return None, True
 
 class fringe:
     """
@@ -267,20 +308,10 @@ class fringe:
 
         Returns True if this fringe is considered "less than" the other.
         """
-        diff = self.L.l_lo - other.L.l_lo
+        diff = self.fops[-1].left[-1] - other.fops[-1].left[-1]
         if diff != 0:
             return diff < 0
-        return self.H.l_hi < other.H.l_hi
-
-    @property
-    def H(self):
-        """Return the first fringe_opposed_subset (highest)."""
-        return self.fops[0]
-
-    @property
-    def L(self):
-        """Return the last fringe_opposed_subset (lowest)."""
-        return self.fops[-1]
+        return self.fops[0].left[0] < other.fops[0].left[0]
 
     def merge(self, other):
         """
@@ -288,30 +319,40 @@ class fringe:
 
         This involves merging alike edges, merging opposite edges, and
         forming an 'onion' structure to maintain planarity constraints.
+
+        Returns:
+            bool: False if the fringes cannot be merged (planarity violated).
         """
-        other._merge_t_alike_edges()
+        if not other._merge_t_alike_edges():
+            return False
         self._merge_t_opposite_edges_into(other)
-        if not self.H.right:
-            other._align_duplicates(self.L.l_hi)
-        else:
-            self._make_onion_structure(other)
-        if other.H.left:
-            self.fops.appendleft(other.H)
+        if not self.fops[0].right:
+            other._align_duplicates(self.fops[-1].left[0])
+        elif not self._make_onion_structure(other):
+            return False
+        other_h = other.fops[0]
+        if other_h.left:
+            self.fops.appendleft(other_h)
+        return True
 
     def _merge_t_alike_edges(self):
         """
         Merge alike edges (same side) within the fringe.
 
-        Raises:
-            Exception: If the highest subset has right edges (invalid state).
+        Returns:
+            bool: False if a subset has right edges (planarity violated).
         """
-        if self.H.right:
-            raise Exception
-        for f in islice(self.fops, 1, len(self.fops)):
+        fops = self.fops
+        h = fops.popleft()
+        if h.right:
+            return False
+        for f in fops:
             if f.right:
-                raise Exception
-            self.H.left.extend(f.left)
-        self.fops = deque([self.fops[0]])
+                return False
+            h.left.extend(f.left)
+        fops.clear()
+        fops.append(h)
+        return True
 
     def _merge_t_opposite_edges_into(self, other):
         """
@@ -320,9 +361,10 @@ class fringe:
         Args:
             other (fringe): Target fringe to merge opposite edges into.
         """
-        while (not self.H.right and self.H.l_hi > other.H.l_lo):
-            other.H.right.extend(self.H.left)
-            self.fops.popleft()
+        fops, other_h = self.fops, other.fops[0]
+        while not fops[0].right and fops[0].left[0] > other_h.left[-1]:
+            other_h.right.extend(fops[0].left)
+            fops.popleft()
 
     def _align_duplicates(self, dfs_h):
         """
@@ -331,8 +373,9 @@ class fringe:
         Args:
             dfs_h (int): DFS height used for detecting duplicates.
         """
-        if self.H.l_lo == dfs_h:
-            self.H.left.pop()
+        h = self.fops[0]
+        if h.left[-1] == dfs_h:
+            h.left.pop()
             self._swap_side()
 
     def _swap_side(self):
@@ -340,8 +383,9 @@ class fringe:
         Swap the left and right sides of the highest fringe_opposed_subset
         if necessary to maintain LR ordering constraints.
         """
-        if not self.H.left or (self.H.right and self.H.l_lo > self.H.r_lo):
-            self.H.c[0], self.H.c[1] = self.H.c[1], self.H.c[0]
+        h = self.fops[0]
+        if not h.left or (h.right and h.left[-1] > h.right[-1]):
+            h.left, h.right = h.right, h.left
 
     def _make_onion_structure(self, other):
         """
@@ -349,18 +393,20 @@ class fringe:
 
         Args:
             other (fringe): Fringe being merged that may require nesting.
-        
-        Raises:
-            Exception: If the onion structure cannot be created (planarity violated).
+
+        Returns:
+            bool: False if the onion structure cannot be created (planarity violated).
         """
-        lo, hi = (0, 1) if self.H.l_hi < self.H.r_hi else (1, 0)
-        if other.H.l_lo < self.H.c[lo][0]:
-            raise Exception
-        elif other.H.l_lo < self.H.c[hi][0]:
-            self.H.c[lo].extendleft(reversed(other.H.left))
-            self.H.c[hi].extendleft(reversed(other.H.right))
-            other.H.left.clear()
-            other.H.right.clear()
+        h, other_h = self.fops[0], other.fops[0]
+        lo, hi = (h.left, h.right) if h.left[0] < h.right[0] else (h.right, h.left)
+        if other_h.left[-1] < lo[0]:
+            return False
+        elif other_h.left[-1] < hi[0]:
+            lo.extendleft(reversed(other_h.left))
+            hi.extendleft(reversed(other_h.right))
+            other_h.left.clear()
+            other_h.right.clear()
+        return True
 
     def prune(self, dfs_height):
         """
@@ -370,17 +416,19 @@ class fringe:
             dfs_height (int): The current DFS height to prune against.
         """
 
+        fops = self.fops
         left_, right_ = self.__lr_condition(dfs_height)
-        while self.fops and (left_ or right_):
+        while fops and (left_ or right_):
+            h = fops[0]
             if left_:
-                self.H.left.popleft()
+                h.left.popleft()
             if right_:
-                self.H.right.popleft()
-            if not self.H.left and not self.H.right:
-                self.fops.popleft()
+                h.right.popleft()
+            if not h.left and not h.right:
+                fops.popleft()
             else:
                 self._swap_side()
-            if self.fops:
+            if fops:
                 left_, right_ = self.__lr_condition(dfs_height)
 
     def __lr_condition(self, dfs_height):
@@ -394,8 +442,9 @@ class fringe:
         Returns:
             tuple(bool, bool): (left_violation, right_violation)
         """
-        return (self.H.left and self.H.l_hi >= dfs_height,
-                self.H.right and self.H.r_hi >= dfs_height)
+        h = self.fops[0]
+        return (h.left and h.left[0] >= dfs_height,
+                h.right and h.right[0] >= dfs_height)
 
 
 # fringe opposed subset
@@ -405,174 +454,550 @@ class fringe_opposed_subset:
     Represents a subset of edges in a fringe for the LR planarity algorithm.
 
     Each subset maintains two opposed sequences of DFS heights:
-    - left (c[0]): DFS heights of edges on the left side.
-    - right (c[1]): DFS heights of edges on the right side.
+    - left: DFS heights of edges on the left side.
+    - right: DFS heights of edges on the right side.
+
+    This class is used to track opposed edges during planarity testing.
+    The highest height of a side is its first element, the lowest its last.
 
-    This class is used to track opposed edges during planarity testing
-    and supports convenient access to high/low DFS heights.
+    `left` and `right` are plain slot attributes rather than properties,
+    because the fringe operations read them on every merge and prune step.
 
     Attributes:
-        c (list[deque[int]]): List of two deques [left, right] storing DFS heights.
+        left (deque[int]): DFS heights of left edges.
+        right (deque[int]): DFS heights of right edges.
     """
 
-    __slots__ = ['c']
+    __slots__ = ['left', 'right']
 
     def __init__(self, h):
-        self.c = [deque([h]), deque()]
+        self.left = deque([h])
+        self.right = deque()
 
-    @property
-    def left(self):
-        """
-        Get the left sequence of DFS heights.
 
-        Returns:
-            deque[int]: DFS heights of left edges.
-        """
-        return self.c[0]
+def add_edge(graph: dict[int, set[int]], u: int, v: int):
+    """adds edge to graph"""
+    graph[u].add(v)
+    graph[v].add(u)
 
-    @property
-    def right(self):
-        """
-        Get the right sequence of DFS heights.
 
-        Returns:
-            deque[int]: DFS heights of right edges.
-        """
-        return self.c[1]
+def remove_edge(graph: dict[int, set[int]], u: int, v: int):
+    """removes edge to graph"""
+    graph[u].remove(v)
+    graph[v].remove(u)
 
-    @property
-    def l_lo(self):
-        """
-        Get the lowest DFS height on the left side.
 
-        Returns:
-            int: The last element of the left deque.
-        """
-        return self.c[0][-1]
+def get_edges(graph: dict[int, set[int]]):
+    """Return a list of all edges in the graph as tuples (u, v).
+
+    Each edge is listed once with u < v, in order of the sorted vertices.
+
+    Args:
+        graph (dict[int, set[int]]): Adjacency dictionary.
+
+    Returns:
+        list[tuple[int,int]]: List of edges.
+    """
+    return [(u, v) for u in sorted(graph) for v in graph[u] if v > u]
+
+def is_planar_lr(graph_dict: dict[int, set[int]]) -> bool:
+    """
+    Connects adjacency dictionary to LR-algorithm.
+
+    `lr_algorithm` only iterates neighbours with `g[v]`, which a plain
+    adjacency dictionary supports as well as a networkx.Graph, so the test
+    runs directly on `graph_dict` without building a networkx graph.
+
+    Before that, vertices are filtered by degree: a subdivision of K5 needs
+    five vertices of degree >= 4 and a subdivision of K3,3 needs six
+    vertices of degree >= 3. If neither set of candidates is large enough,
+    the graph is planar by Kuratowski's theorem.
+
+    Args:
+        graph_dict (dict[int, set[int]]): adjacency dictionary of the graph.
+
+    Returns:
+        bool: True if planar, False otherwise.
+    """
+    k5_candidates = [v for v, nbrs in graph_dict.items() if len(nbrs) >= 4]
+    if len(k5_candidates) < 5:
+        k33_candidates = [v for v, nbrs in graph_dict.items() if len(nbrs) >= 3]
+        if len(k33_candidates) < 6:
+            return True
+
+    # isolated vertices do not count towards the Euler bound
+    degrees = list(map(len, graph_dict.values()))
+    m, n = sum(degrees) // 2, len(degrees) - degrees.count(0)
+
+    if m < 9 or n < 5:
+        return True
+
+    # m > 3n - 6
+    if m > 3 * n - 6:
+        return False
+
+    return lr_planarity(graph_dict, graph_dict, dict.fromkeys(graph_dict, -1))
+
+
+class incremental_planar_graph:
+    """
+    Planar subgraph that is grown and shrunk one edge at a time.
+
+    The DFS only ever adds or removes a single edge per step, so instead of
+    the add_edge/is_planar_lr/remove_edge triad it keeps this object and asks
+    it to try an edge. An edge that touches a vertex with no edges yet is a
+    bridge to a new vertex and can never break planarity, so it is accepted
+    without running the LR-algorithm. Otherwise only the connected component
+    of the new edge is re-tested: every other component is unchanged and
+    was planar before.
+
+    The number of vertices of degree >= 3 and >= 4 is kept up to date on
+    every change, so the Kuratowski degree filter of `is_planar_lr` is an
+    O(1) check here instead of a scan over all vertices. The same goes for
+    the edge and non-isolated vertex counts used by its size rules.
+
+    Vertices are the integers 0..n-1, so the adjacency is a list of sets
+    and the LR-algorithm keeps its DFS heights in a flat list.
 
-    @property
-    def l_hi(self):
+    Attributes:
+        graph (list[set[int]]): Adjacency list of the current subgraph.
+        deg3 (int): Number of vertices of degree >= 3.
+        deg4 (int): Number of vertices of degree >= 4.
+        size (int): Number of edges.
+        order (int): Number of vertices of degree >= 1.
+    """
+
+    __slots__ = ['graph', 'deg3', 'deg4', 'size', 'order']
+
+    def __init__(self, n: int):
         """
-        Get the highest DFS height on the left side.
+        Initialize an empty subgraph.
 
-        Returns:
-            int: The first element of the left deque.
+        Args:
+            n (int): Number of vertices, labelled 0..n-1.
         """
-        return self.c[0][0]
+        self.graph = [set() for _ in range(n)]
+        self.deg3 = 0
+        self.deg4 = 0
+        self.size = 0
+        self.order = 0
 
-    @property
-    def r_lo(self):
+    def try_add_edge(self, u: int, v: int) -> bool:
         """
-        Get the lowest DFS height on the right side.
+        Add edge (u, v) if the subgraph stays planar.
+
+        Runs once per DFS node, so the set updates and the degree counting
+        are written inline here and in `add_edge`/`remove_edge` rather than
+        going through the module-level helpers.
+
+        Args:
+            u (int): First endpoint.
+            v (int): Second endpoint.
 
         Returns:
-            int: The last element of the right deque.
+            bool: True if the edge was added, False if it would break planarity
+                  (the subgraph is left unchanged).
         """
-        return self.c[1][-1]
+        nu, nv = self.graph[u], self.graph[v]
+        pendant = not nu or not nv
+        nu.add(v)
+        nv.add(u)
+        self.size += 1
+        for d in (len(nu), len(nv)):
+            if d == 1:
+                self.order += 1
+            elif d == 3:
+                self.deg3 += 1
+            elif d == 4:
+                self.deg4 += 1
+
+        if pendant or (self.deg4 < 5 and self.deg3 < 6) or self._is_planar(u):
+            return True
+
+        self.remove_edge(u, v)
+        return False
 
-    @property
-    def r_hi(self):
+    def add_edge(self, u: int, v: int):
+        """Add edge (u, v) that is already known to keep the subgraph planar."""
+        nu, nv = self.graph[u], self.graph[v]
+        nu.add(v)
+        nv.add(u)
+        self.size += 1
+        for d in (len(nu), len(nv)):
+            if d == 1:
+                self.order += 1
+            elif d == 3:
+                self.deg3 += 1
+            elif d == 4:
+                self.deg4 += 1
+
+    def remove_edge(self, u: int, v: int):
+        """Remove edge (u, v) previously added with try_add_edge."""
+        nu, nv = self.graph[u], self.graph[v]
+        for d in (len(nu), len(nv)):
+            if d == 1:
+                self.order -= 1
+            elif d == 3:
+                self.deg3 -= 1
+            elif d == 4:
+                self.deg4 -= 1
+        nu.remove(v)
+        nv.remove(u)
+        self.size -= 1
+
+    def _is_planar(self, u):
         """
-        Get the highest DFS height on the right side.
+        Check planarity of the subgraph right after an edge at `u` was added.
 
-        Returns:
-            int: The first element of the right deque.
+        The subgraph was planar before the edge was added and only the
+        connected component of `u` has changed, so the LR-algorithm is run
+        on that component alone (see `is_planar_lr` for the size rules).
         """
-        return self.c[1][0]
+        m, n = self.size, self.order
 
+        if m < 9 or n < 5:
+            return True
 
+        # m > 3n - 6
+        if m > 3 * n - 6:
+            return False
 
-def add_edge(graph: dict[int, set[int]], u: int, v: int):
-    """adds edge to graph"""
-    graph[u].add(v)
-    graph[v].add(u)
+        dfs_heights = [-1] * len(self.graph)
+        dfs_heights[u] = 0
+        return lr_algorithm(self.graph, u, dfs_heights)
 
 
-def remove_edge(graph: dict[int, set[int]], u: int, v: int):
-    """removes edge to graph"""
-    graph[u].remove(v)
-    graph[v].remove(u)
+def reduce_graph(graph: dict[int, set[int]]):
+    """Remove leaves and contract degree-2 vertices before the search.
 
+    - A vertex of degree 1 hangs on the rest of the graph by a single edge,
+      which can always be kept without breaking planarity; it is removed
+      and the edge goes to the always-kept list.
+    - A vertex w of degree 2 with neighbours a, b (not adjacent) is replaced
+      by a virtual edge (a, b) standing for the path a - w - b. If the
+      virtual edge ends up in the planar subgraph the whole path is kept,
+      otherwise all of the path but one edge is.
 
-def get_edges(graph: dict[int, set[int]]):
-    """Return a list of all edges in the graph as tuples (u, v).
+    Both rules are applied until neither one fires, so long chains collapse
+    to a single edge and every removed vertex cuts the search tree in half.
 
     Args:
         graph (dict[int, set[int]]): Adjacency dictionary.
 
     Returns:
-        list[tuple[int,int]]: List of edges.
+        tuple[dict[int, set[int]], list[tuple[int,int]], dict[tuple[int,int], list[tuple[int,int]]]]:
+            The reduced graph (same vertices, removed ones isolated),
+            the edges that are always kept, and a mapping from every
+            virtual edge (u, v), u < v, to the original path it stands for.
     """
-    edges = []
-    for u in graph:
-        for v in graph[u]:
-            if u < v:
-                edges.append((u, v))
-    return edges
+    reduced = {u: set(nbrs) for u, nbrs in graph.items()}
+    always_kept = []
+    chains = {}
+
+    def take_path(a, b):
+        """Pop the original edges behind the reduced edge (a, b)."""
+        e = (a, b) if a < b else (b, a)
+        return chains.pop(e, [e])
+
+    queue = list(reduced)
+    while queue:
+        w = queue.pop()
+        nbrs = reduced[w]
+
+        if len(nbrs) == 1:
+            a = nbrs.pop()
+            reduced[a].remove(w)
+            always_kept.extend(take_path(w, a))
+            queue.append(a)
+
+        elif len(nbrs) == 2:
+            a, b = nbrs
+            if b in reduced[a]:
+                continue
+            path = take_path(a, w) + take_path(w, b)
+            nbrs.clear()
+            reduced[a].remove(w)
+            reduced[b].remove(w)
+            add_edge(reduced, a, b)
+            chains[(a, b) if a < b else (b, a)] = path
+
+    return reduced, always_kept, chains
+
+
+def planar_edge_bound(graph: dict[int, set[int]]) -> int:
+    """Upper bound on the number of edges of any planar subgraph.
+
+    By Euler's formula a planar graph on n >= 3 vertices has at most
+    3n - 6 edges. If the graph has no triangles, every face has at least
+    four sides and the bound tightens to 2n - 4. Only vertices with at
+    least one edge are counted.
+
+    Triangles are detected with bitset adjacency rows (a Python int per
+    vertex): edge (u, v) lies on a triangle iff rows[u] & rows[v] != 0.
 
-def is_planar_lr(graph_dict: dict[int, set[int]]) -> bool:
+    Args:
+        graph (dict[int, set[int]]): Adjacency dictionary.
+
+    Returns:
+        int: Maximum number of edges a planar subgraph can have.
     """
-    Connects adjacency dictionary to LR-algorithm.
+    nodes = [u for u in graph if graph[u]]
+    n = len(nodes)
+    if n < 3:
+        return n * (n - 1) // 2
+
+    bit = {u: 1 << i for i, u in enumerate(nodes)}
+    rows = {u: sum(bit[v] for v in graph[u]) for u in nodes}
+
+    if any(rows[u] & rows[v] for u, v in get_edges(graph)):
+        return 3 * n - 6
+    return 2 * n - 4
+
+
+def greedy_planar_edges(n: int,
+                        edges: list[tuple[int, int]]) -> list[tuple[int, int]]:
+    """Greedily build a maximal planar subgraph.
+
+    Edges are taken in the given order and each one is kept if the subgraph
+    stays planar. The result is not necessarily maximum, but it is a cheap
+    lower bound for the branch & bound in `dfs`.
 
     Args:
-        graph_dict (dict[int, set[int]]): adjacency dictionary of the graph.
+        n (int): Number of vertices, labelled 0..n-1.
+        edges (list[tuple[int,int]]): Edges of the graph in the order to try them.
 
     Returns:
-        bool: True if planar, False otherwise.
+        list[tuple[int,int]]: Kept edges.
     """
-    G = nx.Graph()
-    for u, neighbors in graph_dict.items():
-        for v in neighbors:
-            if u < v:
-                G.add_edge(u, v)
-    return is_planar(G)
+    state = incremental_planar_graph(n)
+    return [(u, v) for u, v in edges if state.try_add_edge(u, v)]
 
 
-def dfs(graph: dict[int, set[int]],
+def dfs(state: incremental_planar_graph,
         all_edges: list[tuple[int, int]],
         index: int,
-        current: list[tuple[int,int]],
-        subgraph: dict[str, list[tuple[int,int]]]):
+        current: array,
+        subgraph: dict[str, array],
+        max_edges: int,
+        best_size: Synchronized | None = None):
     """Backtracking DFS to find the largest planar subgraph.
 
+    The search tree is walked with an explicit stack instead of recursion,
+    so large inputs do not hit the interpreter recursion limit. Each frame
+    is `(index, action)`: ENTER decides edge `index`, POP_INCLUDE undoes
+    the edge added for the include-branch once its subtree is done.
+
+    Every subgraph of a planar graph is planar, so for each index the last
+    edge set accepted there is cached. When the include-branch of a later
+    node is a subset of it, the edge is added without a planarity test.
+    This is common: after an exclude-branch the search usually re-takes
+    the same edges as before, minus the excluded one. Edge sets are kept
+    as int bitmasks (bit i = edge i), so building the candidate set and
+    the subset test are single integer operations.
+
     Args:
-        graph: Working adjacency dictionary (modified during DFS)
+        state: Planar subgraph built so far (modified during DFS)
         all_edges: List of all edges of the original graph
         index: Current edge index in all_edges
-        current: Candidate edges in current subgraph
-        subgraph: Dictionary storing the best planar edges found {"edges": [...]}
+        current: Indices (into all_edges) of the edges in the current subgraph,
+                 an array('i') used as a stack
+        subgraph: Dictionary storing the indices of the best planar edges found {"edges": [...]}
+        max_edges: Upper bound on the size of a planar subgraph (`planar_edge_bound`)
+        best_size: Optional multiprocessing.Value with the best size found by any
+                   worker process, used as an extra bound in `parallel_dfs`
 
     Updates subgraph["edges"] in place.
     """
-    subgraph_list = subgraph["edges"]
-    remaining = len(all_edges) - index
+    ENTER, POP_INCLUDE = 0, 1
+
+    # the loop runs once per search-tree node, so everything it touches
+    # is bound to a local up front
+    m = len(all_edges)
+    known_planar = [0] * m
+    mask = 0
+    for i in current:
+        mask |= 1 << i
+    stack = [(index, ENTER)]
+    push, pop = stack.append, stack.pop
+    add_edge, try_add_edge, remove_edge = state.add_edge, state.try_add_edge, state.remove_edge
+    best = len(subgraph["edges"])
+
+    while stack:
+        index, action = pop()
+
+        if action == POP_INCLUDE:
+            current.pop()
+            mask ^= 1 << index
+            remove_edge(*all_edges[index])
+            continue
+
+        bound = best
+        if best_size is not None:
+            shared = best_size.value
+            if shared > bound:
+                bound = shared
+        size = len(current)
+
+        # branch & bound
+        # no branch can beat the Euler bound, so once the best subgraph
+        # reaches it every remaining frame is cut and the search unwinds
+        if min(size + m - index, max_edges) <= bound:
+            continue
+
+        # if the end -> stop
+        # if better then the best -> replace
+        # once the Euler bound is reached no further edge can be added either
+        if index == m or size >= max_edges:
+            if size > bound:
+                best = size
+                subgraph["edges"] = current[:]
+                if best_size is not None:
+                    with best_size.get_lock():
+                        best_size.value = max(best_size.value, size)
+            continue
+
+        u, v = all_edges[index]
+
+        # exclude-branch, explored after the include-branch subtree
+        push((index + 1, ENTER))
+
+        candidate = mask | 1 << index
+        if candidate & known_planar[index] == candidate:
+            add_edge(u, v)
+        elif try_add_edge(u, v):
+            known_planar[index] = candidate
+        else:
+            continue
+
+        mask = candidate
+        current.append(index)
+        push((index, POP_INCLUDE))
+        push((index + 1, ENTER))
+
+
+# shared best size of `parallel_dfs`, set per worker process by `_init_worker`
+_shared_best_size = None
+
+
+def _init_worker(best_size):
+    """Store the shared best size in a worker process of `parallel_dfs`."""
+    global _shared_best_size
+    _shared_best_size = best_size
+
+
+def _dfs_worker(n, all_edges, prefix, depth, max_edges):
+    """Run `dfs` below a fixed assignment of the first `depth` edges."""
+    state = incremental_planar_graph(n)
+    for i in prefix:
+        state.add_edge(*all_edges[i])
+
+    subgraph = {"edges": array('i')}
+    dfs(state, all_edges, depth, array('i', prefix), subgraph, max_edges, _shared_best_size)
+    return subgraph["edges"]
+
+
+def parallel_dfs(n: int,
+                 all_edges: list[tuple[int, int]],
+                 subgraph: dict[str, array],
+                 max_edges: int,
+                 processes: int):
+    """Run the backtracking DFS in several processes.
+
+    The first `depth` levels of the search tree are unrolled: every
+    include/exclude assignment of the first `depth` edges whose included
+    edges are planar becomes one `dfs` task. The workers only share the
+    size of the best subgraph found so far, which each of them uses as
+    its branch & bound incumbent.
+
+    Args:
+        n (int): Number of vertices, labelled 0..n-1.
+        all_edges (list[tuple[int,int]]): Edges in search order.
+        subgraph (dict[str, array]): Indices of the best planar edges found
+            so far {"edges": [...]}, updated in place.
+        max_edges (int): Upper bound on the size of a planar subgraph.
+        processes (int): Number of worker processes.
+    """
+    depth = min(len(all_edges), processes.bit_length() + 2)
+
+    prefixes = []
+    for choice in product((True, False), repeat=depth):
+        state = incremental_planar_graph(n)
+        prefix = []
+        for i, take in enumerate(choice):
+            if take:
+                if not state.try_add_edge(*all_edges[i]):
+                    break
+                prefix.append(i)
+        else:
+            prefixes.append(prefix)
 
-    # branch & bound
-    if len(current) + remaining <= len(subgraph_list):
-        return
+    best_size = multiprocessing.Value('i', len(subgraph["edges"]))
+    with ProcessPoolExecutor(processes, initializer=_init_worker,
+                             initargs=(best_size,)) as pool:
+        futures = [pool.submit(_dfs_worker, n, all_edges, prefix, depth, max_edges)
+                   for prefix in prefixes]
+        for future in futures:
+            edges = future.result()
+            if len(edges) > len(subgraph["edges"]):
+                subgraph["edges"] = edges
 
-    # if the end -> stop
-    # if better then the best -> replace
-    if index == len(all_edges):
-        if len(current) > len(subgraph_list):
-            subgraph["edges"] = current.copy()
-        return
 
-    u, v = all_edges[index]
+def maximum_planar_block(block: dict[int, set[int]],
+                         processes: int = 1) -> list[tuple[int, int]]:
+    """Compute the edges of a maximum planar subgraph of one block.
 
-    add_edge(graph, u, v)
+    Runs the reduction, the greedy seed and the branch & bound DFS on a
+    single biconnected component (any graph works, but the search is
+    exponential in its number of edges, so it should be as small as
+    possible).
 
-    if is_planar_lr(graph):
-        current.append((u, v))
-        dfs(graph, all_edges, index + 1, current, subgraph)
-        current.pop()
+    Args:
+        block (dict[int, set[int]]): Adjacency dictionary of the block.
+        processes (int): Number of processes for the search (default: 1).
+
+    Returns:
+        list[tuple[int,int]]: Edges of a maximum planar subgraph of the block.
+    """
+    reduced, always_kept, chains = reduce_graph(block)
+
+    # the search runs on the remaining vertices relabelled to 0..n-1
+    nodes = [u for u in reduced if reduced[u]]
+    id_of = {u: i for i, u in enumerate(nodes)}
+    n = len(nodes)
+
+    # edges between high-degree vertices are the likeliest to be rejected,
+    # deciding them first lets branch & bound cut whole subtrees early
+    all_edges = [(id_of[u], id_of[v]) for u, v in get_edges(reduced)]
+    all_edges.sort(key=lambda e: len(reduced[nodes[e[0]]]) + len(reduced[nodes[e[1]]]),
+                   reverse=True)
+
+    # the first DFS descent is itself a greedy pass in `all_edges` order,
+    # so seed the bound with a greedy pass in the opposite order
+    index_of = {e: i for i, e in enumerate(all_edges)}
+    seed = greedy_planar_edges(n, all_edges[::-1])
+    planar = {"edges": array('i', [index_of[e] for e in seed])}
+    max_edges = planar_edge_bound(reduced)
+
+    # a seed meeting the Euler bound is already optimal, no search needed
+    if len(planar["edges"]) < max_edges:
+        if processes > 1:
+            parallel_dfs(n, all_edges, planar, max_edges, processes)
+        else:
+            dfs(incremental_planar_graph(n), all_edges, 0, array('i'), planar, max_edges)
 
-    remove_edge(graph, u, v)
+    # a dropped virtual edge still keeps all but one edge of its path
+    kept = {all_edges[i] for i in planar["edges"]}
+    edges = list(always_kept)
+    for e in all_edges:
+        original = (nodes[e[0]], nodes[e[1]])
+        path = chains.get(original, [original])
+        edges.extend(path if e in kept else path[:-1])
 
-    dfs(graph, all_edges, index + 1, current, subgraph)
+    return edges
 
 
-def maximum_planar_subgraph(graph: dict[int, set[int]]) -> dict[int, set[int]]:
+def maximum_planar_subgraph(graph: dict[int, set[int]],
+                            processes: int = 1) -> dict[int, set[int]]:
     """Compute the maximum planar subgraph of an undirected graph.
 
     This function performs a DFS-based backtracking algorithm to select
@@ -580,22 +1005,79 @@ def maximum_planar_subgraph(graph: dict[int, set[int]]) -> dict[int, set[int]]:
     It returns a new adjacency dictionary containing only the edges
     of the maximum planar subgraph.
 
+    A graph is planar iff each of its biconnected components is, so the
+    graph is split into blocks and every block is searched on its own:
+    the cost drops from 2^m to the sum of 2^m_i over the blocks. Blocks
+    that are planar already are kept whole after a single LR test.
+
+    With several processes, the remaining blocks are independent tasks:
+    if there is more than one, each block is searched in its own worker
+    process, largest first; a single block is split with `parallel_dfs`.
+
     Args:
         graph (dict[int, set[int]]): undirected graph as an adjacency dictionary.
+        processes (int): Number of processes for the search (default: 1).
 
     Returns:
         dict[int, set[int]]: Maximum planar subgraph.
     """
-    graph_copy = {u: set() for u in graph}
-    all_edges = get_edges(graph)
+    G = nx.Graph()
+    G.add_edges_from(get_edges(graph))
+
+    result = {u: set() for u in graph}
+    blocks = []
+    for component in nx.biconnected_component_edges(G):
+        block = {}
+        for u, v in component:
+            block.setdefault(u, set()).add(v)
+            block.setdefault(v, set()).add(u)
+
+        # a block that is already planar (e.g. fewer than 9 edges) is its
+        # own maximum planar subgraph, no search needed
+        if is_planar_lr(block):
+            for u, v in component:
+                add_edge(result, u, v)
+        else:
+            blocks.append(block)
+
+    if processes > 1 and len(blocks) > 1:
+        blocks.sort(key=lambda block: sum(map(len, block.values())), reverse=True)
+        with ProcessPoolExecutor(min(processes, len(blocks))) as pool:
+            solved = list(pool.map(maximum_planar_block, blocks))
+    else:
+        solved = [maximum_planar_block(block, processes) for block in blocks]
+
+    for edges in solved:
+        for u, v in edges:
+            add_edge(result, u, v)
+
+    return result
+
+
+def maximal_planar_subgraph(graph: dict[int, set[int]]) -> dict[int, set[int]]:
+    """Compute a maximal planar subgraph of an undirected graph.
+
+    Incremental heuristic: edges are tried one by one, ordered by ascending
+    endpoint degree sum so that sparse regions are filled first, and each
+    edge is kept if the subgraph stays planar. No edge can be added to the
+    result without breaking planarity, but it is not necessarily maximum.
+    It needs only m planarity tests instead of the exponential search of
+    `maximum_planar_subgraph`.
+
+    Args:
+        graph (dict[int, set[int]]): undirected graph as an adjacency dictionary.
+
+    Returns:
+        dict[int, set[int]]: Maximal planar subgraph.
+    """
+    nodes = list(graph)
+    id_of = {u: i for i, u in enumerate(nodes)}
 
-    planar = {"edges": []}
-    dfs(graph_copy, all_edges, 0, [], planar)
+    edges = [(id_of[u], id_of[v]) for u, v in get_edges(graph)]
+    edges.sort(key=lambda e: len(graph[nodes[e[0]]]) + len(graph[nodes[e[1]]]))
 
-    # build result
     result = {u: set() for u in graph}
-    for u, v in planar["edges"]:
-        result[u].add(v)
-        result[v].add(u)
+    for a, b in greedy_planar_edges(len(nodes), edges):
+        add_edge(result, nodes[a], nodes[b])
 
     return result
@@ -4,12 +4,23 @@ Module contains functions to read graphs from
 """
 
 import re
+from collections import defaultdict
+
+# edge statements are matched on raw bytes, so lines are never decoded
+_DIGRAPH_EDGE_RE = re.compile(rb'(\d+)\s*->\s*(\d+)')
+_GRAPH_EDGE_RE = re.compile(rb'(\d+)\s*--\s*(\d+)')
+
+# the `graph` / `digraph` keyword opens the file, so its head is enough
+_HEADER_PROBE_SIZE = 4096
 
 
 def read_graph_from_dot(filename: str) -> tuple[dict[int, set[int]], bool]:
     """
     Reads graph from .dot file
 
+    The file is read line by line, so an edge statement is expected
+    to fit on a single line.
+
     Args:
         filename (str): File name or path to the file
 
@@ -19,39 +30,25 @@ def read_graph_from_dot(filename: str) -> tuple[dict[int, set[int]], bool]:
             Second element states the type of graph: True - directed, False - undirected
 
     """
-    graph = {}
-    is_directed = False
-
-    with open(filename, 'r', encoding='UTF-8') as file:
-        content = file.read()
-
-        if 'digraph' in content:
-            is_directed = True
-            edge_pattern = r'(\d+)\s*->\s*(\d+)'
-        else:
-            is_directed = False
-            edge_pattern = r'(\d+)\s*--\s*(\d+)'
-
-        edges = re.findall(edge_pattern, content)
-
-        for v1, v2 in edges:
-            v1, v2 = int(v1), int(v2)
+    graph = defaultdict(set)
 
-            if is_directed:
-                if v1 not in graph:
-                    graph[v1] = set()
-                graph[v1].add(v2)
+    with open(filename, 'rb') as file:
+        is_directed = b'digraph' in file.read(_HEADER_PROBE_SIZE)
+        file.seek(0)
 
-            else:
-                if v1 not in graph:
-                    graph[v1] = set()
-                if v2 not in graph:
-                    graph[v2] = set()
+        if is_directed:
+            for line in file:
+                for v1, v2 in _DIGRAPH_EDGE_RE.findall(line):
+                    graph[int(v1)].add(int(v2))
 
-                graph[v1].add(v2)
-                graph[v2].add(v1)
+        else:
+            for line in file:
+                for v1, v2 in _GRAPH_EDGE_RE.findall(line):
+                    v1, v2 = int(v1), int(v2)
+                    graph[v1].add(v2)
+                    graph[v2].add(v1)
 
-    return graph, is_directed
+    return dict(graph), is_directed
 
 
 def read_graph_from_csv(filename):
@@ -83,11 +80,10 @@ def read_graph_from_csv(filename):
             v1, v2 = map(int, parts)
             edges.append((v1, v2))
 
-    is_directed = False
-    for v1, v2 in edges:
-        if (v2, v1) in edges:
-            is_directed = True
-            break
+    # a reversed pair means the file lists both directions; a set keeps
+    # this check linear instead of a scan of `edges` per edge
+    edge_set = set(edges)
+    is_directed = any((v2, v1) in edge_set for v1, v2 in edges)
 
     for v1, v2 in edges:
         if v1 not in graph:
@@ -14,23 +14,13 @@ def write_graph_to_csv(graph: dict[int, set[int]], filename: str, is_directed: b
         is_directed (bool): Type of the graph (default: `False`)
     """
 
-    with open(filename, 'w', encoding='utf-8') as file:
-
-        if is_directed:
-            for v1, neighbors in sorted(graph.items()):
-                for v2 in sorted(neighbors):
-                    file.write(f"{v1},{v2}\n")
-
-        else:
-            written_edges = set()
+    # an undirected edge is written once, from its lower endpoint
+    lines = [f"{v1},{v2}\n"
+             for v1, neighbors in sorted(graph.items())
+             for v2 in sorted(w for w in neighbors if is_directed or w >= v1)]
 
-            for v1, neighbors in sorted(graph.items()):
-                for v2 in sorted(neighbors):
-                    edge = tuple(sorted((v1, v2)))
-
-                    if edge not in written_edges:
-                        file.write(f"{edge[0]},{edge[1]}\n")
-                        written_edges.add(edge)
+    with open(filename, 'w', encoding='utf-8') as file:
+        file.write("".join(lines))
 
 
 def write_graph_to_dot(graph: dict[int, set[int]], filename: str, is_directed: bool = False):
@@ -47,23 +37,13 @@ def write_graph_to_dot(graph: dict[int, set[int]], filename: str, is_directed: b
     # Choose edge symbol: -> for directed, -- for undirected
     edge_symbol = "->" if is_directed else "--"
 
-    with open(filename, 'w', encoding='utf-8') as file:
-        # Write DOT header
-        file.write(f"{graph_type} planar {{\n")
-
-        if is_directed:
-            for u, neighbors in sorted(graph.items()):
-                for v in sorted(neighbors):
-                    file.write(f"    {u} {edge_symbol} {v};\n")
+    # DOT header, one statement per edge, closing brace;
+    # an undirected edge is written once, from its lower endpoint
+    lines = [f"{graph_type} planar {{\n"]
+    lines.extend(f"    {u} {edge_symbol} {v};\n"
+                 for u, neighbors in sorted(graph.items())
+                 for v in sorted(w for w in neighbors if is_directed or w >= u))
+    lines.append("}\n")
 
-        else:
-            written_edges = set()
-            for u, neighbors in sorted(graph.items()):
-                for v in sorted(neighbors):
-                    edge = tuple(sorted((u, v)))
-                    if edge not in written_edges:
-                        file.write(f"    {edge[0]} {edge_symbol} {edge[1]};\n")
-                        written_edges.add(edge)
-
-        # Close DOT graph
-        file.write("}\n")
+    with open(filename, 'w', encoding='utf-8') as file:
+        file.write("".join(lines))
@@ -86,14 +86,20 @@ def main():
     Main functionality of the module
 
     """
-    parser = argparse.ArgumentParser(prog="Find maximum planar subgraph")
+    parser = argparse.ArgumentParser(prog="Find maximal or maximum planar subgraph")
     subparsers = parser.add_subparsers(dest="command", required=True)
 
     # compute
     compute_parser = subparsers.add_parser("compute")
     compute_parser.add_argument("graph_file", help="File that contain graph")
-    compute_parser.add_argument("output_graph_file", help="File to write the maximum planar subgraph")
+    compute_parser.add_argument("output_graph_file", help="File to write the planar subgraph: maximal (greedy heuristic) "
+                                     "by default, maximum with --exact")
     compute_parser.add_argument("--csv", action="store_true", help="Specify that input is from .csv file")
+    compute_parser.add_argument("--exact", action="store_true",
+                                help="Find a maximum planar subgraph with the exact (exponential) search "
+                                     "instead of a maximal one with the greedy heuristic")
+    compute_parser.add_argument("--processes", type=int, default=1,
+                                help="Number of processes used for the exact search, requires --exact (default: 1)")
 
     # picture
     show_parser = subparsers.add_parser("picture", help="Create a picture of the graph (matplotlib + networkx)")
@@ -102,6 +108,9 @@ def main():
 
     args = parser.parse_args()
 
+    if args.command == "compute" and args.processes != 1 and not args.exact:
+        compute_parser.error("--processes requires --exact")
+
     if args.command == "compute":
         try:
             if args.csv:
@@ -114,7 +123,10 @@ def main():
             print(f"Cannot find {args.graph_file}")
             sys.exit(1)
 
-        planar_subgraph = tools.maximum_planar_subgraph(graph)
+        if args.exact:
+            planar_subgraph = tools.maximum_planar_subgraph(graph, processes=args.processes)
+        else:
+            planar_subgraph = tools.maximal_planar_subgraph(graph)
         try:
             write_graph.write_graph_to_dot(planar_subgraph, args.output_graph_file)
         except PermissionError:
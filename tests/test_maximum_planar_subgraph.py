@@ -0,0 +1,121 @@
+"""
+Brute-force regression tests for `maximum_planar_subgraph`
+
+Run from the repository root:
+    python -m unittest discover tests
+"""
+
+import random
+import unittest
+from itertools import combinations
+
+import networkx as nx
+
+from algorithm import tools
+
+
+def brute_force_size(graph: dict[int, set[int]]) -> int:
+    """
+    Size of a maximum planar subgraph, found by trying every edge subset
+
+    Args:
+        graph (dict[int, set[int]]): Small undirected graph
+
+    Returns:
+        int: Number of edges of a maximum planar subgraph
+    """
+    edges = tools.get_edges(graph)
+    for k in range(len(edges), -1, -1):
+        for subset in combinations(edges, k):
+            if nx.check_planarity(nx.Graph(subset))[0]:
+                return k
+    return 0
+
+
+def random_graph(rng: random.Random, subdivide: float = 0.0) -> dict[int, set[int]]:
+    """
+    Random small graph with non-contiguous labels
+
+    Args:
+        rng (random.Random): Source of randomness
+        subdivide (float): Probability of replacing an edge by a path of 2-3 edges
+
+    Returns:
+        dict[int, set[int]]: Undirected graph as an adjacency dictionary
+    """
+    n = rng.randint(5, 9)
+    m = rng.randint(n, min(13, n * (n - 1) // 2))
+    G = nx.gnm_random_graph(n, m, seed=rng.randrange(10**9))
+    labels = rng.sample(range(100), n)
+
+    graph = {labels[u]: set() for u in G}
+    extra = 100
+    for u, v in G.edges():
+        path = [labels[u]]
+        if rng.random() < subdivide:
+            k = rng.randint(1, 2)
+            path.extend(range(extra, extra + k))
+            extra += k
+        path.append(labels[v])
+        for a, b in zip(path, path[1:]):
+            graph.setdefault(a, set()).add(b)
+            graph.setdefault(b, set()).add(a)
+    return graph
+
+
+class TestMaximumPlanarSubgraph(unittest.TestCase):
+    """Compare `maximum_planar_subgraph` with a brute-force search"""
+
+    def check(self, graph: dict[int, set[int]], processes: int = 1, size: int | None = None):
+        """Check that the result is a planar subgraph of maximum size
+
+        The maximum size is found by brute force unless `size` is given.
+        """
+        result = tools.maximum_planar_subgraph(graph, processes=processes)
+
+        self.assertEqual(set(result), set(graph))
+        for u in result:
+            for v in result[u]:
+                self.assertIn(v, graph[u])
+                self.assertIn(u, result[v])
+
+        G = nx.Graph()
+        G.add_nodes_from(result)
+        G.add_edges_from(tools.get_edges(result))
+        self.assertTrue(nx.check_planarity(G)[0])
+        if size is None:
+            size = brute_force_size(graph)
+        self.assertEqual(G.size(), size, graph)
+
+    def test_random_graphs(self):
+        """Dense graphs, exercising the subset cache in `dfs`"""
+        rng = random.Random(0)
+        for _ in range(40):
+            self.check(random_graph(rng))
+
+    def test_subdivided_graphs(self):
+        """Graphs with leaves and long paths, exercising `reduce_graph`"""
+        rng = random.Random(1)
+        for _ in range(40):
+            graph = random_graph(rng, subdivide=0.4)
+            if sum(map(len, graph.values())) // 2 <= 16:
+                self.check(graph)
+
+    def test_parallel(self):
+        """The same search split over processes by `parallel_dfs`"""
+        rng = random.Random(2)
+        for _ in range(5):
+            self.check(random_graph(rng), processes=2)
+
+    def test_named_graphs(self):
+        """Known sizes of maximum planar subgraphs (checked by exhaustive search)"""
+        for G, size in [(nx.complete_graph(5), 9),
+                        (nx.complete_bipartite_graph(3, 3), 8),
+                        (nx.petersen_graph(), 13),
+                        (nx.chvatal_graph(), 19),
+                        (nx.desargues_graph(), 26)]:
+            self.check({u: set(G[u]) for u in G}, size=size)
+
+
+if __name__ == "__main__":
+    unittest.main()